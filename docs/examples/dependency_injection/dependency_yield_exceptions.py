@@ -1,9 +1,17 @@
-from typing import Dict, Generator
+from dataclasses import dataclass
+from typing import Dict, Generator, Optional
 
 from starlite import Starlite, get
 from starlite.di import Provide
 
-STATE = {"result": None, "connection": "closed"}
+
+@dataclass
+class State:
+    result: Optional[str] = None
+    connection: str = "closed"
+
+
+STATE = State()
 
 
 def generator_function() -> Generator[str, None, None]:
@@ -12,13 +20,13 @@ def generator_function() -> Generator[str, None, None]:
     If an error occurs, set `result` to `"error"`, else set it to `"OK"`.
     """
     try:
-        STATE["connection"] = "open"
+        STATE.connection = "open"
         yield "hello"
-        STATE["result"] = "OK"
+        STATE.result = "OK"
     except ValueError:
-        STATE["result"] = "error"
+        STATE.result = "error"
     finally:
-        STATE["connection"] = "closed"
+        STATE.connection = "closed"
 
 
 @get("/{name:str}", dependencies={"message": Provide(generator_function)})
@@ -1,3 +1,4 @@
+from math import ceil
 from typing import List
 
 from pydantic import BaseModel
@@ -25,10 +26,11 @@ class PersonClassicPaginator(AbstractSyncClassicPaginator[Person]):
         self.data = PersonFactory.batch(50)
 
     def get_total(self, page_size: int) -> int:
-        return round(len(self.data) / page_size)
+        return ceil(len(self.data) / page_size)
 
     def get_items(self, page_size: int, current_page: int) -> List[Person]:
-        return [self.data[i : i + page_size] for i in range(0, len(self.data), page_size)][current_page - 1]
+        start = (current_page - 1) * page_size
+        return self.data[start : start + page_size]
 
 
 paginator = PersonClassicPaginator()
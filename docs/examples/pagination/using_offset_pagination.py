@@ -1,4 +1,3 @@
-from itertools import islice
 from typing import List
 
 from pydantic import BaseModel
@@ -29,7 +28,7 @@ class PersonOffsetPaginator(AbstractSyncOffsetPaginator[Person]):
         return len(self.data)
 
     def get_items(self, limit: int, offset: int) -> List[Person]:
-        return list(islice(islice(self.data, offset, None), limit))
+        return self.data[offset : offset + limit]
 
 
 paginator = PersonOffsetPaginator()
@@ -12,3 +12,12 @@ def test_using_classic_pagination() -> None:
         assert response_data["total_pages"] == 10
         assert response_data["page_size"] == 5
         assert response_data["current_page"] == 1
+
+
+def test_using_classic_pagination_partial_last_page() -> None:
+    with TestClient(app) as client:
+        response = client.get("/people", params={"page_size": 7, "current_page": 8})
+        assert response.status_code == HTTP_200_OK
+        response_data = response.json()
+        assert len(response_data["items"]) == 1
+        assert response_data["total_pages"] == 8
@@ -17,7 +17,7 @@ from typing_extensions import Concatenate, ParamSpec
 
 from starlite import Starlite, __version__
 from starlite.middleware import DefineMiddleware
-from starlite.utils import get_name
+from starlite.utils import get_enum_string_value, get_name
 
 __all__ = (
     "LoadedApp",
@@ -317,7 +317,10 @@ def show_app_info(app: Starlite) -> None:  # pragma: no cover
         openapi_enabled += f" path=[yellow]{app.openapi_config.openapi_controller.path}"
     table.add_row("OpenAPI", openapi_enabled)
 
-    table.add_row("Compression", app.compression_config.backend if app.compression_config else "[red]Disabled")
+    table.add_row(
+        "Compression",
+        get_enum_string_value(app.compression_config.backend) if app.compression_config else "[red]Disabled",
+    )
 
     if app.template_engine:
         table.add_row("Template engine", type(app.template_engine).__name__)
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from .exceptions import NotFoundError
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator, Sequence
+
     from typing_extensions import TypeAlias
 
     from .filters import BeforeAfter, CollectionFilter, LimitOffset
@@ -16,11 +18,17 @@ __all__ = ("AbstractRepository", "FilterTypes")
 T = TypeVar("T")
 RepoT = TypeVar("RepoT", bound="AbstractRepository")
 CollectionT = TypeVar("CollectionT")
+ChunkT = TypeVar("ChunkT")
 
 FilterTypes: TypeAlias = "BeforeAfter | CollectionFilter[Any] | LimitOffset"
 """Aggregate type alias of the types supported for collection filtering."""
 
 
+async def _iterate(items: list[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
+
+
 class AbstractRepository(Generic[T], metaclass=ABCMeta):
     """Interface for persistent data interaction."""
 
@@ -28,6 +36,8 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
     """Type of object represented by the repository."""
     id_attribute = "id"
     """Name of the primary identifying attribute on :attr:`model_type`."""
+    _batch_size: ClassVar[int] = 1000
+    """Maximum number of items sent to the backend in a single round trip by the ``*_many`` methods."""
 
     def __init__(self, **kwargs: Any) -> None:
         """Repository constructors accept arbitrary kwargs."""
@@ -48,6 +58,10 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
     async def add_many(self, data: list[T]) -> list[T]:
         """Add multiple ``data`` to the collection.
 
+        Implementations should issue one round trip per chunk of :attr:`_batch_size <AbstractRepository._batch_size>`
+        instances (see :meth:`_chunks <AbstractRepository._chunks>`), never one statement or transaction per instance.
+        For SQLAlchemy this is a single executemany, e.g. ``await session.execute(insert(Model), rows)``.
+
         Args:
             data: Instances to be added to the collection.
 
@@ -55,6 +69,17 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             The added instances.
         """
 
+    async def add_many_unreturning(self, data: list[T]) -> None:
+        """Add multiple ``data`` to the collection without returning the added instances.
+
+        Delegates to :meth:`add_many` by default. Implementations should override it where the backend has a faster
+        bulk path that does not read rows back, e.g. ``COPY`` via ``asyncpg``'s ``copy_records_to_table()``.
+
+        Args:
+            data: Instances to be added to the collection.
+        """
+        await self.add_many(data)
+
     @abstractmethod
     async def count(self, *filters: FilterTypes, **kwargs: Any) -> int:
         """Get the count of records returned by a query.
@@ -85,6 +110,9 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
     async def delete_many(self, item_ids: list[Any]) -> list[T]:
         """Delete multiple instances identified by list of IDs ``item_ids``.
 
+        Implementations should issue one round trip per chunk of :attr:`_batch_size <AbstractRepository._batch_size>`
+        identifiers, e.g. ``DELETE ... WHERE id IN (...)``, never one statement per identifier.
+
         Args:
             item_ids: list of Identifiers to be deleted.
 
@@ -92,6 +120,17 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             The deleted instances.
         """
 
+    async def delete_many_unreturning(self, item_ids: list[Any]) -> None:
+        """Delete multiple instances identified by list of IDs ``item_ids`` without returning them.
+
+        Delegates to :meth:`delete_many` by default. Implementations should override it where the backend can skip
+        selecting or ``RETURNING`` the deleted rows.
+
+        Args:
+            item_ids: list of Identifiers to be deleted.
+        """
+        await self.delete_many(item_ids)
+
     @abstractmethod
     async def exists(self, **kwargs: Any) -> bool:
         """Return true if the object specified by ``kwargs`` exists.
@@ -174,6 +213,9 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
     async def update_many(self, data: "list[T]") -> list[T]:
         """Update multiple instances with the attribute values present on instances in ``data``.
 
+        Implementations should issue one round trip per chunk of :attr:`_batch_size <AbstractRepository._batch_size>`
+        instances, e.g. ``await session.execute(update(Model), rows)``, never one statement per instance.
+
         Args:
             data: A list of instance that should have a value for :attr:`id_attribute <AbstractRepository.id_attribute>` that exists in the
                 collection.
@@ -185,6 +227,18 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             NotFoundError: If no instance found with same identifier as ``data``.
         """
 
+    async def update_many_unreturning(self, data: list[T]) -> None:
+        """Update multiple instances with the attribute values present on ``data`` without returning them.
+
+        Delegates to :meth:`update_many` by default. Implementations should override it where the backend can skip
+        ``RETURNING`` or re-selecting the updated rows.
+
+        Args:
+            data: A list of instance that should have a value for :attr:`id_attribute <AbstractRepository.id_attribute>` that exists in the
+                collection.
+        """
+        await self.update_many(data)
+
     @abstractmethod
     async def upsert(self, data: T) -> T:
         """Update or create instance.
@@ -208,6 +262,9 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
     async def list_and_count(self, *filters: FilterTypes, **kwargs: Any) -> tuple[list[T], int]:
         """List records with total count.
 
+        Implementations should fetch the records and the total count in a single query where the backend allows it, e.g.
+        by selecting a ``count(*) OVER ()`` window column alongside the records.
+
         Args:
             *filters: Types for specific filtering operations.
             **kwargs: Instance attribute value filters.
@@ -216,6 +273,23 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             a tuple containing The list of instances, after filtering applied, and a count of records returned by query, ignoring pagination.
         """
 
+    async def iter_and_count(self, *filters: FilterTypes, **kwargs: Any) -> tuple[AsyncIterator[T], int]:
+        """Iterate over records with total count.
+
+        Delegates to :meth:`list_and_count` by default, which materializes every record. Implementations should
+        override it to stream records from the backend, e.g. through a server-side cursor, so that memory use is bound
+        by the batch size rather than by the number of records.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            a tuple containing an async iterator of instances, after filtering applied, and a count of records returned by query, ignoring pagination.
+        """
+        items, count = await self.list_and_count(*filters, **kwargs)
+        return _iterate(items), count
+
     @abstractmethod
     async def list(self, *filters: FilterTypes, **kwargs: Any) -> "list[T]":
         """Get a list of instances, optionally filtered.
@@ -243,10 +317,26 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             RepositoryError: if a named attribute doesn't exist on :attr:`model_type <AbstractRepository.model_type>`.
         """
 
+    @classmethod
+    def _chunks(cls, data: Sequence[ChunkT]) -> Iterator[Sequence[ChunkT]]:
+        """Split ``data`` into consecutive chunks of at most :attr:`_batch_size <AbstractRepository._batch_size>` items.
+
+        Args:
+            data: Items, or identifiers of items, to be processed in batches.
+
+        Returns:
+            An iterator of slices of ``data``, each of which should be sent to the backend in a single round trip.
+        """
+        batch_size = cls._batch_size
+        return (data[idx : idx + batch_size] for idx in range(0, len(data), batch_size))
+
     @staticmethod
     def check_not_found(item_or_none: T | None) -> T:
         """Raise :class:`NotFoundError` if ``item_or_none`` is ``None``.
 
+        Implementations whose hot paths already branch on the ``None`` case, such as ``get()``, may raise
+        :class:`NotFoundError` directly instead of paying for the extra call.
+
         Args:
             item_or_none: Item to be tested for existence.
 
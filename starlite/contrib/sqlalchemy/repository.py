@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Generic, Literal, Tuple, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, Tuple, TypeVar, cast
 
 from sqlalchemy import delete, over, select, text, update
 from sqlalchemy import func as sql_func
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from starlite.contrib.repository.abc import AbstractRepository
-from starlite.contrib.repository.exceptions import ConflictError, RepositoryError
+from starlite.contrib.repository.exceptions import (
+    ConflictError,
+    NotFoundError,
+    RepositoryError,
+)
 from starlite.contrib.repository.filters import (
     BeforeAfter,
     CollectionFilter,
@@ -22,7 +26,7 @@ if TYPE_CHECKING:
 
     from sqlalchemy import Select
     from sqlalchemy.engine import Result
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 
     from starlite.contrib.repository import FilterTypes
     from starlite.contrib.sqlalchemy import base
@@ -63,6 +67,11 @@ def wrap_sqlalchemy_exception() -> Any:
 class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
     """SQLAlchemy based implementation of the repository interface."""
 
+    _batch_size = 450
+    """Kept below SQLite's default limit of 999 bound parameters per statement."""
+    _fetch_size: ClassVar[int] = 1000
+    """Number of rows buffered per fetch when streaming results from :meth:`iter_and_count`."""
+
     def __init__(
         self, *, session: AsyncSession, base_select: Select[tuple[ModelT]] | None = None, **kwargs: Any
     ) -> None:
@@ -142,31 +151,35 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         """
         with wrap_sqlalchemy_exception():
             instances: list[ModelT] = []
-            chunk_size = 450
-            for idx in range(0, len(item_ids), chunk_size):
-                chunk = item_ids[idx : min(idx + chunk_size, len(item_ids))]
-                if self.session.bind.dialect.delete_executemany_returning:
+            id_column = getattr(self.model_type, self.id_attribute)
+            supports_returning = self.session.bind.dialect.delete_executemany_returning
+            for chunk in self._chunks(item_ids):
+                if supports_returning:
                     instances.extend(
                         await self.session.scalars(
-                            delete(self.model_type)
-                            .where(getattr(self.model_type, self.id_attribute).in_(chunk))
-                            .returning(self.model_type)
+                            delete(self.model_type).where(id_column.in_(chunk)).returning(self.model_type)
                         )
                     )
                 else:
-                    instances.extend(
-                        await self.session.scalars(
-                            select(self.model_type).where(getattr(self.model_type, self.id_attribute).in_(chunk))
-                        )
-                    )
-                    await self.session.execute(
-                        delete(self.model_type).where(getattr(self.model_type, self.id_attribute).in_(chunk))
-                    )
+                    instances.extend(await self.session.scalars(select(self.model_type).where(id_column.in_(chunk))))
+                    await self.session.execute(delete(self.model_type).where(id_column.in_(chunk)))
             await self.session.flush()
             for instance in instances:
                 self.session.expunge(instance)
             return instances
 
+    async def delete_many_unreturning(self, item_ids: list[Any]) -> None:
+        """Delete instances identified by ``item_ids`` without selecting or returning them.
+
+        Args:
+            item_ids: Identifiers of instances to be deleted.
+        """
+        with wrap_sqlalchemy_exception():
+            id_column = getattr(self.model_type, self.id_attribute)
+            for chunk in self._chunks(item_ids):
+                await self.session.execute(delete(self.model_type).where(id_column.in_(chunk)))
+            await self.session.flush()
+
     async def exists(self, **kwargs: Any) -> bool:
         """Return true if the object specified by ``kwargs`` exists.
 
@@ -196,7 +209,8 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         with wrap_sqlalchemy_exception():
             statement = self._filter_select_by_kwargs(statement=self.statement, **{self.id_attribute: item_id})
             instance = (await self._execute(statement)).scalar_one_or_none()
-            instance = self.check_not_found(instance)
+            if instance is None:
+                raise NotFoundError("No item found when one was expected")
             self.session.expunge(instance)
             return instance
 
@@ -215,7 +229,8 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         with wrap_sqlalchemy_exception():
             statement = self._filter_select_by_kwargs(statement=self.statement, **kwargs)
             instance = (await self._execute(statement)).scalar_one_or_none()
-            instance = self.check_not_found(instance)
+            if instance is None:
+                raise NotFoundError("No item found when one was expected")
             self.session.expunge(instance)
             return instance
 
@@ -311,7 +326,7 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             NotFoundError: If no instance found with same identifier as `data`.
         """
-        data_to_update: list[dict[str, Any]] = [v.to_dict() if isinstance(v, self.model_type) else v for v in data]  # type: ignore
+        data_to_update = self._to_update_values(data)
         with wrap_sqlalchemy_exception():
             if self.session.bind.dialect.update_executemany_returning:
                 instances = list(
@@ -331,6 +346,19 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             await self.session.flush()
             return data
 
+    async def update_many_unreturning(self, data: list[ModelT]) -> None:
+        """Update one or more instances with the attribute values present on `data` without returning them.
+
+        Args:
+            data: A list of instances to update.  Each should have a value for `self.id_attribute` that exists in the
+                collection.
+        """
+        data_to_update = self._to_update_values(data)
+        with wrap_sqlalchemy_exception():
+            for chunk in self._chunks(data_to_update):
+                await self.session.execute(update(self.model_type), chunk)
+            await self.session.flush()
+
     async def list_and_count(
         self,
         *filters: FilterTypes,
@@ -365,6 +393,32 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
                     count = count_value
             return instances, count
 
+    async def iter_and_count(
+        self,
+        *filters: FilterTypes,
+        **kwargs: Any,
+    ) -> tuple[abc.AsyncGenerator[ModelT, None], int]:
+        """Iterate over records with total count.
+
+        Records are streamed from the database in batches of ``_fetch_size`` rows, the count is fetched with a separate
+        query beforehand. The stream holds its database cursor open until it is exhausted or closed, so consume it fully
+        or call ``aclose()`` on it before the session is reused or closed.
+
+        Args:
+            *filters: Types for specific filtering operations.
+            **kwargs: Instance attribute value filters.
+
+        Returns:
+            An async generator of the instances, after filtering applied, and a count of records returned by query,
+            ignoring pagination.
+        """
+        count = await self.count(*filters, **kwargs)
+        statement = self._apply_filters(*filters, statement=self.statement)
+        statement = self._filter_select_by_kwargs(statement, **kwargs)
+        with wrap_sqlalchemy_exception():
+            result = await self.session.stream_scalars(statement.execution_options(yield_per=self._fetch_size))
+        return self._expunge_stream(result), count
+
     async def list(self, *filters: FilterTypes, **kwargs: Any) -> list[ModelT]:
         """Get a list of instances, optionally filtered.
 
@@ -461,6 +515,18 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             return await self.session.merge(model)
         raise ValueError("Unexpected value for `strategy`, must be `'add'` or `'merge'`")
 
+    def _to_update_values(self, data: abc.Iterable[ModelT]) -> abc.Sequence[dict[str, Any]]:
+        return [v.to_dict() if isinstance(v, self.model_type) else cast("dict[str, Any]", v) for v in data]
+
+    async def _expunge_stream(self, result: AsyncScalarResult[ModelT]) -> abc.AsyncGenerator[ModelT, None]:
+        try:
+            with wrap_sqlalchemy_exception():
+                async for instance in result:
+                    self.session.expunge(instance)
+                    yield instance
+        finally:
+            await result.close()
+
     async def _execute(self, statement: Select[RowT]) -> Result[RowT]:
         return cast("Result[RowT]", await self.session.execute(statement))
 
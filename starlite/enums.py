@@ -1,6 +1,8 @@
 from enum import Enum
 
 __all__ = (
+    "BrotliMode",
+    "CompressionBackend",
     "CompressionEncoding",
     "HttpMethod",
     "MediaType",
@@ -76,3 +78,18 @@ class CompressionEncoding(str, Enum):
 
     GZIP = "gzip"
     BROTLI = "br"
+
+
+class CompressionBackend(str, Enum):
+    """An Enum for supported compression backends."""
+
+    GZIP = "gzip"
+    BROTLI = "brotli"
+
+
+class BrotliMode(str, Enum):
+    """An Enum for brotli compression modes."""
+
+    GENERIC = "generic"
+    TEXT = "text"
+    FONT = "font"
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from starlite.constants import SCOPE_STATE_RESPONSE_COMPRESSED
 from starlite.datastructures import Headers, MutableScopeHeaders
-from starlite.enums import CompressionEncoding, ScopeType
+from starlite.enums import BrotliMode, CompressionBackend, CompressionEncoding, ScopeType
 from starlite.exceptions import MissingDependencyException
 from starlite.middleware.base import AbstractMiddleware
 from starlite.utils import Ref, set_starlite_scope_state
@@ -25,16 +25,26 @@ if TYPE_CHECKING:
         Send,
     )
 
-    try:
-        from brotli import Compressor
-    except ImportError:
-        Compressor = Any
+
+try:
+    from brotli import MODE_FONT, MODE_GENERIC, MODE_TEXT, Compressor
+
+    brotli_installed = True
+    _BROTLI_MODES: dict[str, int] = {
+        BrotliMode.TEXT: int(MODE_TEXT),
+        BrotliMode.FONT: int(MODE_FONT),
+        BrotliMode.GENERIC: int(MODE_GENERIC),
+    }
+except ImportError:
+    Compressor = Any  # pyright: ignore
+    brotli_installed = False
+    _BROTLI_MODES = {}
 
 
 class CompressionFacade:
     """A unified facade offering a uniform interface for different compression libraries."""
 
-    __slots__ = ("compressor", "buffer", "compression_encoding")
+    __slots__ = ("compressor", "buffer", "compression_encoding", "chunk_size")
 
     compressor: GzipFile | Compressor  # pyright: ignore
 
@@ -48,21 +58,15 @@ class CompressionFacade:
         """
         self.buffer = buffer
         self.compression_encoding = compression_encoding
+        self.chunk_size = config.brotli_buffer_size
 
         if compression_encoding == CompressionEncoding.BROTLI:
-            try:
-                from brotli import MODE_FONT, MODE_GENERIC, MODE_TEXT, Compressor
-            except ImportError as e:
-                raise MissingDependencyException("brotli is not installed") from e
-
-            modes: dict[Literal["generic", "text", "font"], int] = {
-                "text": int(MODE_TEXT),
-                "font": int(MODE_FONT),
-                "generic": int(MODE_GENERIC),
-            }
+            if not brotli_installed:
+                raise MissingDependencyException("brotli is not installed")
+
             self.compressor = Compressor(
                 quality=config.brotli_quality,
-                mode=modes[config.brotli_mode],
+                mode=_BROTLI_MODES[config.brotli_mode],
                 lgwin=config.brotli_lgwin,
                 lgblock=config.brotli_lgblock,
             )
@@ -80,7 +84,10 @@ class CompressionFacade:
         """
 
         if self.compression_encoding == CompressionEncoding.BROTLI:
-            self.buffer.write(self.compressor.process(body) + self.compressor.flush())  # type: ignore
+            view = memoryview(body)
+            for start in range(0, len(view), self.chunk_size):
+                self.buffer.write(self.compressor.process(view[start : start + self.chunk_size]))  # type: ignore
+            self.buffer.write(self.compressor.flush())  # type: ignore
         else:
             self.compressor.write(body)
 
@@ -109,10 +116,12 @@ class CompressionMiddleware(AbstractMiddleware):
             app: The ``next`` ASGI app to call.
             config: An instance of CompressionConfig.
         """
-        super().__init__(
-            app=app, exclude=config.exclude, exclude_opt_key=config.exclude_opt_key, scopes={ScopeType.HTTP}
-        )
+        super().__init__(app=app, exclude_opt_key=config.exclude_opt_key, scopes={ScopeType.HTTP})
+        if config._exclude_pattern is not None:
+            self.exclude_pattern = config._exclude_pattern
         self.config = config
+        self.brotli_enabled = config.backend == CompressionBackend.BROTLI and brotli_installed
+        self.gzip_enabled = config.backend == CompressionBackend.GZIP or config.brotli_gzip_fallback
 
     async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """ASGI callable.
@@ -127,7 +136,7 @@ class CompressionMiddleware(AbstractMiddleware):
         """
         accept_encoding = Headers.from_scope(scope).get("accept-encoding", "")
 
-        if CompressionEncoding.BROTLI in accept_encoding and self.config.backend == "brotli":
+        if self.brotli_enabled and CompressionEncoding.BROTLI in accept_encoding:
             await self.app(
                 scope,
                 receive,
@@ -137,9 +146,7 @@ class CompressionMiddleware(AbstractMiddleware):
             )
             return
 
-        if CompressionEncoding.GZIP in accept_encoding and (
-            self.config.backend == "gzip" or self.config.brotli_gzip_fallback
-        ):
+        if self.gzip_enabled and CompressionEncoding.GZIP in accept_encoding:
             await self.app(
                 scope,
                 receive,
@@ -169,11 +176,24 @@ class CompressionMiddleware(AbstractMiddleware):
         """
 
         buffer = BytesIO()
-        facade = CompressionFacade(buffer=buffer, compression_encoding=compression_encoding, config=self.config)
+        facade = Ref[Optional[CompressionFacade]](None)
+        minimum_size = self.config.minimum_size
 
         initial_message = Ref[Optional["HTTPResponseStartEvent"]](None)
         started = Ref[bool](False)
 
+        def get_facade() -> CompressionFacade:
+            """Construct the compressor on first use, so that responses which are not compressed never pay for it.
+
+            Returns:
+                A :class:`CompressionFacade` instance.
+            """
+            if facade.value is None:
+                facade.value = CompressionFacade(
+                    buffer=buffer, compression_encoding=compression_encoding, config=self.config
+                )
+            return facade.value
+
         async def send_wrapper(message: "Message") -> None:
             """Handle and compresses the HTTP Message with brotli.
 
@@ -198,7 +218,7 @@ class CompressionMiddleware(AbstractMiddleware):
                         del headers["Content-Length"]
                         set_starlite_scope_state(scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
 
-                        facade.write(body)
+                        get_facade().write(body)
 
                         message["body"] = buffer.getvalue()
                         buffer.seek(0)
@@ -206,9 +226,10 @@ class CompressionMiddleware(AbstractMiddleware):
                         await send(initial_message.value)
                         await send(message)
 
-                    elif len(body) >= self.config.minimum_size:
-                        facade.write(body)
-                        facade.close()
+                    elif len(body) >= minimum_size:
+                        compressor = get_facade()
+                        compressor.write(body)
+                        compressor.close()
                         body = buffer.getvalue()
 
                         headers = MutableScopeHeaders(initial_message.value)
@@ -226,9 +247,10 @@ class CompressionMiddleware(AbstractMiddleware):
                         await send(message)
 
                 else:
-                    facade.write(body)
+                    compressor = get_facade()
+                    compressor.write(body)
                     if not more_body:
-                        facade.close()
+                        compressor.close()
 
                     message["body"] = buffer.getvalue()
 
@@ -18,6 +18,7 @@ from starlite.openapi.spec import (
     Server,
     Tag,
 )
+from starlite.utils.compat import DATACLASS_SLOTS
 
 __all__ = ("OpenAPIConfig",)
 
@@ -26,7 +27,16 @@ if TYPE_CHECKING:
     from starlite.types.callable_types import OperationIDCreator
 
 
-@dataclass
+_DEFAULT_ENABLED_ENDPOINTS = frozenset({"redoc", "swagger", "elements", "openapi.json", "openapi.yaml"})
+_COMPONENTS_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(Components))
+"""Names of the :class:`Components <starlite.openapi.spec.components.Components>` fields merged by ``to_openapi_schema``."""
+
+
+def _default_servers() -> list[Server]:
+    return [Server(url="/")]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OpenAPIConfig:
     """Configuration for OpenAPI.
 
@@ -71,7 +81,7 @@ class OpenAPIConfig:
 
     Should be an instance of :class:`Components <starlite.openapi.spec.components.Components>` or a list thereof.
     """
-    servers: list[Server] = field(default_factory=lambda: [Server(url="/")])
+    servers: list[Server] = field(default_factory=_default_servers)
     """A list of :class:`Server <starlite.openapi.spec.server.Server>` instances."""
     summary: str | None = field(default=None)
     """A summary text."""
@@ -88,16 +98,22 @@ class OpenAPIConfig:
     """
     root_schema_site: Literal["redoc", "swagger", "elements"] = "redoc"
     """The static schema generator to use for the "root" path of `/schema/`."""
-    enabled_endpoints: set[str] = field(
-        default_factory=lambda: {"redoc", "swagger", "elements", "openapi.json", "openapi.yaml"}
-    )
-    """A set of the enabled documentation sites and schema download endpoints."""
+    enabled_endpoints: set[str] | frozenset[str] = field(default=_DEFAULT_ENABLED_ENDPOINTS)
+    """A set of the enabled documentation sites and schema download endpoints.
+
+    The default is an immutable ``frozenset`` shared by all instances. To change it, assign a new set rather than
+    mutating it in place.
+    """
     operation_id_creator: OperationIDCreator = default_operation_id_creator
     """A callable that generates unique operation ids"""
 
     def to_openapi_schema(self) -> OpenAPI:
         """Return an ``OpenAPI`` instance from the values stored in ``self``.
 
+        A list of :attr:`components` is merged on the first call only, the merged instance then replaces the list. A new
+        ``OpenAPI`` instance is returned on every call, as applications populate its ``paths`` in place and the same
+        config may be shared by several applications.
+
         Returns:
             An instance of :class:`OpenAPI <starlite.openapi.spec.open_api.OpenAPI>`.
         """
@@ -105,11 +121,12 @@ class OpenAPIConfig:
         if isinstance(self.components, list):
             merged_components = Components()
             for components in self.components:
-                for key in (f.name for f in fields(components)):
+                for key in _COMPONENTS_FIELD_NAMES:
                     if value := getattr(components, key, None):
-                        merged_value_dict = getattr(merged_components, key, {}) or {}
-                        merged_value_dict.update(value)
-                        setattr(merged_components, key, merged_value_dict)
+                        if (merged_value_dict := getattr(merged_components, key)) is None:
+                            setattr(merged_components, key, dict(value))
+                        else:
+                            merged_value_dict.update(value)
 
             self.components = merged_components
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, TypeVar
 
 from starlite.types import Empty, EmptyType
 
-__all__ = ("async_next",)
+__all__ = ("DATACLASS_SLOTS", "async_next")
 
 
 if TYPE_CHECKING:
@@ -13,6 +14,12 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 D = TypeVar("D")
 
+if sys.version_info >= (3, 10):
+    DATACLASS_SLOTS: dict[str, bool] = {"slots": True}
+    """Keyword arguments enabling ``__slots__`` generation on :func:`dataclass <dataclasses.dataclass>` where supported."""
+else:  # pragma: no cover
+    DATACLASS_SLOTS = {}
+
 try:
     async_next = anext  # pyright: ignore
 except NameError:  # pragma: no cover
@@ -21,7 +28,7 @@ except NameError:  # pragma: no cover
         """Backwards compatibility shim for Python<3.10."""
         try:
             return await gen.__anext__()
-        except StopAsyncIteration as exc:
-            if default is not Empty:
-                return default  # type: ignore[return-value]
-            raise exc
+        except StopAsyncIteration:
+            if default is Empty:
+                raise
+            return default  # type: ignore[return-value]
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from starlite.contrib.repository.exceptions import NotFoundError
+from starlite.contrib.repository.filters import LimitOffset
 from starlite.contrib.repository.testing.generic_mock_repository import (
     GenericMockRepository,
 )
@@ -14,6 +15,8 @@ from starlite.contrib.repository.testing.generic_mock_repository import (
 if TYPE_CHECKING:
     from pytest import MonkeyPatch
 
+    from tests.contrib.sqlalchemy.models import Author
+
 
 def test_repository_check_not_found_raises() -> None:
     """Test `check_not_found()` raises if `None`."""
@@ -42,3 +45,44 @@ def test_repository_set_id_attribute_value(monkeypatch: MonkeyPatch) -> None:
     mock.random_attribute = "this one"
     mock = GenericMockRepository.set_id_attribute_value("no this one", mock)
     assert mock.random_attribute == "no this one"
+
+
+@pytest.mark.parametrize("size, expected", ((0, []), (3, [3]), (4, [3, 1]), (9, [3, 3, 3])))
+def test_repository_chunks(monkeypatch: MonkeyPatch, size: int, expected: list[int]) -> None:
+    """Test data is split into chunks of at most `_batch_size` items."""
+    monkeypatch.setattr(GenericMockRepository, "_batch_size", 3)
+    data = list(range(size))
+    chunks = list(GenericMockRepository._chunks(data))
+    assert [len(chunk) for chunk in chunks] == expected
+    assert [item for chunk in chunks for item in chunk] == data
+
+
+@pytest.mark.parametrize(
+    "method, delegate",
+    (
+        ("add_many_unreturning", "add_many"),
+        ("update_many_unreturning", "update_many"),
+        ("delete_many_unreturning", "delete_many"),
+    ),
+)
+async def test_repository_unreturning_methods_delegate(monkeypatch: MonkeyPatch, method: str, delegate: str) -> None:
+    """Test the default `*_many_unreturning()` implementations delegate to their returning counterparts."""
+    repository: GenericMockRepository[Author] = GenericMockRepository()
+    delegate_mock = AsyncMock(return_value=["anything"])
+    monkeypatch.setattr(repository, delegate, delegate_mock)
+    data = [MagicMock()]
+    assert await getattr(repository, method)(data) is None
+    delegate_mock.assert_awaited_once_with(data)
+
+
+async def test_repository_iter_and_count_delegates(monkeypatch: MonkeyPatch) -> None:
+    """Test the default `iter_and_count()` implementation delegates to `list_and_count()`."""
+    repository: GenericMockRepository[Author] = GenericMockRepository()
+    limit_offset = LimitOffset(limit=2, offset=0)
+    items = [MagicMock(), MagicMock()]
+    list_and_count_mock = AsyncMock(return_value=(items, 5))
+    monkeypatch.setattr(repository, "list_and_count", list_and_count_mock)
+    iterator, count = await repository.iter_and_count(limit_offset, key="value")
+    assert count == 5
+    assert [item async for item in iterator] == items
+    list_and_count_mock.assert_awaited_once_with(limit_offset, key="value")
@@ -12,7 +12,11 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 
-from starlite.contrib.repository.exceptions import ConflictError, RepositoryError
+from starlite.contrib.repository.exceptions import (
+    ConflictError,
+    NotFoundError,
+    RepositoryError,
+)
 from starlite.contrib.repository.filters import (
     BeforeAfter,
     CollectionFilter,
@@ -185,6 +189,20 @@ async def test_sqlalchemy_repo_get_one_member(mock_repo: SQLAlchemyRepository, m
     mock_repo.session.commit.assert_not_called()
 
 
+@pytest.mark.parametrize("method, args, kwargs", (("get", ("instance-id",), {}), ("get_one", (), {"id": "instance-id"})))
+async def test_sqlalchemy_repo_get_not_found(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch, method: str, args: tuple, kwargs: dict
+) -> None:
+    """Test member get operations raise `NotFoundError` when nothing is found."""
+    result_mock = MagicMock()
+    result_mock.scalar_one_or_none = MagicMock(return_value=None)
+    execute_mock = AsyncMock(return_value=result_mock)
+    monkeypatch.setattr(mock_repo, "_execute", execute_mock)
+    with pytest.raises(NotFoundError):
+        await getattr(mock_repo, method)(*args, **kwargs)
+    mock_repo.session.expunge.assert_not_called()
+
+
 async def test_sqlalchemy_repo_get_or_create_member_existing(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
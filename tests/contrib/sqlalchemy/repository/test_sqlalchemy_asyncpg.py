@@ -12,10 +12,12 @@ from uuid import UUID, uuid4
 
 import asyncpg
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy import NullPool, insert
 from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncScalarResult,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -244,6 +246,39 @@ async def test_repo_list_and_count_method(raw_authors: list[dict[str, Any]], aut
     assert len(collection) == exp_count
 
 
+async def test_repo_iter_and_count_method(raw_authors: list[dict[str, Any]], author_repo: AuthorRepository) -> None:
+    """Test SQLALchemy iter with count in asyncpg.
+
+    Args:
+        raw_authors (list[dict[str, Any]]): list of authors pre-seeded into the mock repository
+        author_repo (AuthorRepository): The author mock repository
+    """
+    exp_count = len(raw_authors)
+    iterator, count = await author_repo.iter_and_count()
+    collection = [author async for author in iterator]
+    assert exp_count == count
+    assert len(collection) == exp_count
+    assert {author.name for author in collection} == {author["name"] for author in raw_authors}
+
+
+async def test_repo_iter_and_count_method_closed_early(
+    raw_authors: list[dict[str, Any]], author_repo: AuthorRepository, mocker: MockerFixture
+) -> None:
+    """Test SQLALchemy iter with count in asyncpg closes the result when not fully consumed.
+
+    Args:
+        raw_authors (list[dict[str, Any]]): list of authors pre-seeded into the mock repository
+        author_repo (AuthorRepository): The author mock repository
+        mocker (MockerFixture): Used to spy on closing the streamed result
+    """
+    close_spy = mocker.spy(AsyncScalarResult, "close")
+    iterator, _ = await author_repo.iter_and_count()
+    await iterator.__anext__()
+    await iterator.aclose()
+    close_spy.assert_called_once()
+    assert await author_repo.count() == len(raw_authors)
+
+
 async def test_repo_list_and_count_method_empty(book_repo: BookRepository) -> None:
     """Test SQLALchemy list with count in asyncpg.
 
@@ -322,6 +357,20 @@ async def test_repo_update_many_method(author_repo: AuthorRepository) -> None:
         assert obj.name.startswith("Update")
 
 
+async def test_repo_update_many_unreturning_method(author_repo: AuthorRepository) -> None:
+    """Test SQLALchemy Update Many Unreturning with asyncpg.
+
+    Args:
+        author_repo (AuthorRepository): The author mock repository
+    """
+    objs = await author_repo.list()
+    for idx, obj in enumerate(objs):
+        obj.name = f"Update {idx}"
+    await author_repo.update_many_unreturning(objs)
+    for obj in await author_repo.list():
+        assert obj.name.startswith("Update")
+
+
 async def test_repo_exists_method(author_repo: AuthorRepository) -> None:
     """Test SQLALchemy exists with asyncpg.
 
@@ -378,6 +427,21 @@ async def test_repo_delete_many_method(author_repo: AuthorRepository) -> None:
     assert count == 0
 
 
+async def test_repo_delete_many_unreturning_method(author_repo: AuthorRepository) -> None:
+    """Test SQLALchemy delete many unreturning with asyncpg.
+
+    Args:
+        author_repo (AuthorRepository): The author mock repository
+    """
+    await author_repo.add_many([Author(name=f"author name {idx}") for idx in range(1000)])
+    ids_to_delete = [existing_obj.id for existing_obj in await author_repo.list()]
+    await author_repo.delete_many_unreturning(ids_to_delete)
+    await author_repo.session.commit()
+    data, count = await author_repo.list_and_count()
+    assert data == []
+    assert count == 0
+
+
 async def test_repo_get_method(author_repo: AuthorRepository) -> None:
     """Test SQLALchemy Get with asyncpg.
 
@@ -1,16 +1,18 @@
-from typing import AsyncIterator, Literal
+import warnings
+from typing import Any, AsyncIterator, Dict, List, Literal, Union
 
 import pytest
+from pytest_mock import MockerFixture
 
 from starlite import MediaType, WebSocket, get, websocket
 from starlite.config.compression import CompressionConfig
-from starlite.enums import CompressionEncoding
-from starlite.exceptions import ImproperlyConfiguredException
+from starlite.enums import BrotliMode, CompressionBackend, CompressionEncoding
+from starlite.exceptions import ImproperlyConfiguredException, MissingDependencyException
+from starlite.middleware.compression import CompressionMiddleware
 from starlite.response_containers import Stream
 from starlite.status_codes import HTTP_200_OK
 from starlite.testing import create_test_client
-
-BrotliMode = Literal["text", "generic", "font"]
+from starlite.types import Receive, Scope, Send
 
 
 @get(path="/", media_type=MediaType.TEXT)
@@ -87,6 +89,51 @@ def test_compression_skips_small_responses(
         assert int(response.headers["Content-Length"]) == 10
 
 
+@pytest.mark.parametrize(
+    "backend, compression_encoding", (("brotli", CompressionEncoding.BROTLI), ("gzip", CompressionEncoding.GZIP))
+)
+def test_compressor_not_created_for_small_responses(
+    backend: Literal["gzip", "brotli"], compression_encoding: CompressionEncoding, mocker: MockerFixture
+) -> None:
+    facade_mock = mocker.patch("starlite.middleware.compression.CompressionFacade")
+
+    with create_test_client(
+        route_handlers=[no_compress_handler], compression_config=CompressionConfig(backend=backend)
+    ) as client:
+        response = client.get("/no-compression", headers={"Accept-Encoding": str(compression_encoding.value)})
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "_starlite_"
+
+    facade_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("exclude", ("^/$", ["^/other", "^/$"]))
+def test_compression_exclude_patterns(exclude: Union[str, List[str]]) -> None:
+    config = CompressionConfig(backend="gzip", exclude=exclude)
+    assert config._exclude_pattern is not None
+
+    with create_test_client(route_handlers=[handler], compression_config=config) as client:
+        response = client.get("/", headers={"Accept-Encoding": CompressionEncoding.GZIP.value})
+        assert response.status_code == HTTP_200_OK
+        assert "Content-Encoding" not in response.headers
+
+
+def test_compression_middleware_subclass_exclude_respected() -> None:
+    class ExcludingCompressionMiddleware(CompressionMiddleware):
+        exclude = "^/$"
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        pass
+
+    middleware = ExcludingCompressionMiddleware(app=app, config=CompressionConfig(backend="gzip"))
+    assert middleware.exclude_pattern is not None
+    assert middleware.exclude_pattern.findall("/")
+
+    middleware = ExcludingCompressionMiddleware(app=app, config=CompressionConfig(backend="gzip", exclude="^/other"))
+    assert middleware.exclude_pattern is not None
+    assert not middleware.exclude_pattern.findall("/")
+
+
 def test_brotli_with_gzip_fallback_enabled() -> None:
     with create_test_client(
         route_handlers=[handler], compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=True)
@@ -124,6 +171,23 @@ async def test_skips_for_websocket() -> None:
         assert b"content-encoding" not in dict(ws.scope["headers"])
 
 
+def test_brotli_not_installed_without_gzip_fallback_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("starlite.config.compression.brotli_installed", False)
+    with pytest.raises(MissingDependencyException):
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False)
+
+
+def test_brotli_not_installed_falls_back_to_gzip(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("starlite.config.compression.brotli_installed", False)
+    monkeypatch.setattr("starlite.middleware.compression.brotli_installed", False)
+    with create_test_client(
+        route_handlers=[handler], compression_config=CompressionConfig(backend="brotli", brotli_gzip_fallback=True)
+    ) as client:
+        response = client.get("/", headers={"accept-encoding": "br, gzip"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["Content-Encoding"] == CompressionEncoding.GZIP
+
+
 @pytest.mark.parametrize("minimum_size, should_raise", ((0, True), (1, False), (-1, True), (100, False)))
 def test_config_minimum_size_validation(minimum_size: int, should_raise: bool) -> None:
     if should_raise:
@@ -149,10 +213,62 @@ def test_config_brotli_quality_validation(brotli_quality: int, should_raise: boo
     if should_raise:
         with pytest.raises(ImproperlyConfiguredException):
             CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
+    elif brotli_quality >= 10:
+        with pytest.warns(UserWarning):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
     else:
         CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_quality=brotli_quality)
 
 
+@pytest.mark.parametrize(
+    "backend, brotli_quality, should_warn",
+    (("brotli", 4, False), ("brotli", 9, False), ("brotli", 10, True), ("brotli", 11, True), ("gzip", 11, False)),
+)
+def test_config_brotli_quality_warning(
+    backend: Literal["gzip", "brotli"], brotli_quality: int, should_warn: bool
+) -> None:
+    with warnings.catch_warnings(record=True) as records:
+        warnings.simplefilter("always")
+        CompressionConfig(backend=backend, brotli_quality=brotli_quality)
+
+    assert bool(records) is should_warn
+
+
+@pytest.mark.parametrize(
+    "brotli_buffer_size, should_raise", ((0, True), (1023, True), (1024, False), (4096, False), (65536, False))
+)
+def test_config_brotli_buffer_size_validation(brotli_buffer_size: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_buffer_size=brotli_buffer_size)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_buffer_size=brotli_buffer_size)
+
+
+@pytest.mark.parametrize(
+    "brotli_lgblock, should_raise", ((0, False), (1, True), (15, True), (16, False), (24, False), (25, True))
+)
+def test_config_brotli_lgblock_validation(brotli_lgblock: Any, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_lgblock=brotli_lgblock)
+    else:
+        CompressionConfig(backend="brotli", brotli_gzip_fallback=False, brotli_lgblock=brotli_lgblock)
+
+
+def test_config_coerces_enums() -> None:
+    config = CompressionConfig(backend="brotli", brotli_mode="font")
+    assert config.backend is CompressionBackend.BROTLI
+    assert config.brotli_mode is BrotliMode.FONT
+    assert CompressionConfig(backend=CompressionBackend.GZIP).backend is CompressionBackend.GZIP
+
+
+@pytest.mark.parametrize("kwargs", ({"backend": "zstd"}, {"backend": "brotli", "brotli_mode": "binary"}))
+def test_config_invalid_enum_value_raises(kwargs: Dict[str, Any]) -> None:
+    with pytest.raises(ImproperlyConfiguredException):
+        CompressionConfig(**kwargs)
+
+
 @pytest.mark.parametrize("brotli_lgwin, should_raise", ((9, True), (10, False), (-1, True), (25, True), (24, False)))
 def test_config_brotli_lgwin_validation(brotli_lgwin: int, should_raise: bool) -> None:
     if should_raise:
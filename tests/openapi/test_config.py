@@ -47,6 +47,50 @@ def test_merged_components_correct() -> None:
     }
 
 
+def test_merged_components_do_not_mutate_input() -> None:
+    components_one = Components(headers={"one": OpenAPIHeader()})
+    components_two = Components(headers={"two": OpenAPIHeader()})
+    config = OpenAPIConfig(title="my title", version="1.0.0", components=[components_one, components_two])
+    openapi = config.to_openapi_schema()
+    assert openapi.components
+    assert openapi.components.headers is not None
+    assert set(openapi.components.headers) == {"one", "two"}
+    assert components_one.headers is not None and set(components_one.headers) == {"one"}
+
+
+def test_components_merged_once() -> None:
+    config = OpenAPIConfig(
+        title="my title",
+        version="1.0.0",
+        components=[Components(headers={"one": OpenAPIHeader()}), Components(headers={"two": OpenAPIHeader()})],
+    )
+    first = config.to_openapi_schema()
+    second = config.to_openapi_schema()
+    assert isinstance(config.components, Components)
+    assert first.components is second.components is config.components
+    assert first is not second
+
+
+def test_default_enabled_endpoints_shared_and_immutable() -> None:
+    config_one = OpenAPIConfig(title="one", version="1.0.0")
+    config_two = OpenAPIConfig(title="two", version="1.0.0")
+    assert isinstance(config_one.enabled_endpoints, frozenset)
+    assert config_one.enabled_endpoints is config_two.enabled_endpoints
+    with pytest.raises(AttributeError):
+        config_one.enabled_endpoints.add("x")  # type: ignore[attr-defined]
+
+
+def test_default_servers_not_shared() -> None:
+    config_one = OpenAPIConfig(title="one", version="1.0.0")
+    config_two = OpenAPIConfig(title="two", version="1.0.0")
+    assert config_one.servers is not config_two.servers
+    assert config_one.servers[0] is not config_two.servers[0]
+
+    config_one.to_openapi_schema().servers[0].url = "/api/one"
+    assert config_two.servers[0].url == "/"
+    assert OpenAPIConfig(title="three", version="1.0.0").servers[0].url == "/"
+
+
 def test_by_alias() -> None:
     class ModelWithAlias(BaseModel):
         first: str = Field(alias="second")
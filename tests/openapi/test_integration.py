@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import yaml
 
 from starlite.app import DEFAULT_OPENAPI_CONFIG
@@ -32,8 +34,9 @@ def test_openapi_json() -> None:
 
 
 def test_openapi_yaml_not_allowed() -> None:
-    openapi_config = DEFAULT_OPENAPI_CONFIG
-    openapi_config.enabled_endpoints.discard("openapi.yaml")
+    openapi_config = replace(
+        DEFAULT_OPENAPI_CONFIG, enabled_endpoints=DEFAULT_OPENAPI_CONFIG.enabled_endpoints - {"openapi.yaml"}
+    )
 
     with create_test_client([PersonController, PetController], openapi_config=openapi_config) as client:
         assert client.app.openapi_schema
@@ -44,8 +47,9 @@ def test_openapi_yaml_not_allowed() -> None:
 
 
 def test_openapi_json_not_allowed() -> None:
-    openapi_config = DEFAULT_OPENAPI_CONFIG
-    openapi_config.enabled_endpoints.discard("openapi.json")
+    openapi_config = replace(
+        DEFAULT_OPENAPI_CONFIG, enabled_endpoints=DEFAULT_OPENAPI_CONFIG.enabled_endpoints - {"openapi.json"}
+    )
 
     with create_test_client([PersonController, PetController], openapi_config=openapi_config) as client:
         assert client.app.openapi_schema